@@ -7,6 +7,7 @@ then creates proper citation entries in references.json.
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from html.parser import HTMLParser
 
@@ -14,6 +15,12 @@ DATA_DIR = Path(__file__).parent.parent / "public" / "data"
 SOURCES_DIR = Path("/home/alvaro/LRS/Sources")
 INDEX_FILE = Path(__file__).parent.parent / "documentation" / "source-simulant-index.json"
 
+# Compiled once at import; both are applied to every source without a DB entry
+DOI_RE = re.compile(r'(10\.\d{4,}/[^\s,;)]+)')
+FILENAME_RE = re.compile(r'^(.+?)\s*-\s*(\d{4})\s*-\s*(.+)$')  # "Author et al. - YYYY - Title"
+# Dashboard/database/registry meta-sources are never used as citations
+META_SOURCE_RE = re.compile(r'Dashboard|Database|Registry|Dataset|Wikipedia')
+
 # ── Manually curated citation metadata for key sources ──
 # These are the real papers/reports that our source index matched to simulants.
 # Each key is the HTML filename from LRS/Sources/.
@@ -140,16 +147,28 @@ class TextExtractor(HTMLParser):
     def get_text(self): return ' '.join(self.text)
 
 
+@lru_cache(maxsize=512)
+def _extract_cached(path_str: str, mtime: float) -> str:
+    """Parse an HTML file once per (path, mtime); mtime invalidates stale entries."""
+    with open(path_str, 'r', errors='replace') as f:
+        content = f.read()
+    p = TextExtractor()
+    p.feed(content)
+    return p.get_text()
+
+
+def extract_text(filepath: Path) -> str:
+    """Extract plain text from an HTML source, reusing earlier parses of the same file."""
+    return _extract_cached(str(filepath), filepath.stat().st_mtime)
+
+
 def extract_doi_from_html(filepath: Path) -> str | None:
     """Try to extract a DOI from the first 2000 chars of HTML text."""
     try:
-        with open(filepath, 'r', errors='replace') as f:
-            content = f.read()
-        p = TextExtractor()
-        p.feed(content)
-        text = p.get_text()[:3000]
-        dois = re.findall(r'(10\.\d{4,}/[^\s,;)]+)', text)
-        return dois[0].rstrip('.') if dois else None
+        text = extract_text(filepath)[:3000]
+        # Only the first DOI is used, so stop scanning at the first hit
+        doi = DOI_RE.search(text)
+        return doi.group(1).rstrip('.') if doi else None
     except:
         return None
 
@@ -157,11 +176,7 @@ def extract_doi_from_html(filepath: Path) -> str | None:
 def extract_title_from_html(filepath: Path) -> str | None:
     """Try to extract paper title from first paragraph of HTML."""
     try:
-        with open(filepath, 'r', errors='replace') as f:
-            content = f.read()
-        p = TextExtractor()
-        p.feed(content)
-        text = p.get_text().strip()
+        text = extract_text(filepath).strip()
         # Take first meaningful line (>10 chars, <200 chars)
         for line in text.split('\n'):
             line = line.strip()
@@ -188,7 +203,7 @@ def get_citation(source_file: str) -> dict:
 
     # Try to parse author/year from filename pattern "Author et al. - YYYY - Title"
     fname = source_file.replace('.html', '').replace('.pdf', '')
-    m = re.match(r'^(.+?)\s*-\s*(\d{4})\s*-\s*(.+)$', fname)
+    m = FILENAME_RE.match(fname)
     authors = None
     year = None
     if m:
@@ -243,9 +258,7 @@ def main():
         info = sim_sources.get(sid, {'sources': []})
         sources = info.get('sources', [])
         # Filter out dashboard/database/registry meta-sources
-        good = [s for s in sources
-                if not any(skip in s['title'] for skip in
-                    ['Dashboard', 'Database', 'Registry', 'Dataset', 'Wikipedia'])]
+        good = [s for s in sources if not META_SOURCE_RE.search(s['title'])]
 
         if not good:
             no_source.append(sid)
@@ -13,8 +13,10 @@ import sys
 from pathlib import Path
 from html.parser import HTMLParser
 from collections import defaultdict
+from multiprocessing import Pool
 
 SOURCES_DIR = Path("/home/alvaro/LRS/Sources")
+PDF_DIR = Path("/home/alvaro/LRS")
 SIMULANT_JSON = Path(__file__).parent.parent / "public" / "data" / "simulant.json"
 OUTPUT_FILE = Path(__file__).parent.parent / "documentation" / "source-simulant-index.json"
 OUTPUT_MD = Path(__file__).parent.parent / "documentation" / "source-simulant-index.md"
@@ -99,7 +101,10 @@ def build_simulant_patterns(simulants: list) -> list:
             r'(?<![A-Za-z0-9])' + pattern + r'(?![A-Za-z0-9])',
             re.IGNORECASE
         )
-        patterns.append((sid, name, regex))
+        # Literal prefix every match must contain (hyphens are the only
+        # flexible part of the pattern), used to skip the regex scan cheaply
+        literal = name.lower().split('-')[0]
+        patterns.append((sid, name, regex, literal))
 
     # Sort by name length descending so longer names match first
     # (e.g. "JSC-1AF" before "JSC-1A" before "JSC-1")
@@ -107,16 +112,47 @@ def build_simulant_patterns(simulants: list) -> list:
     return patterns
 
 
+# Characters re.IGNORECASE matches to an ASCII letter that str.lower() does not
+# map to it; folded before lowercasing so the prefilter never skips a match
+IGNORECASE_FOLD = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's'})
+
+
 def find_simulant_mentions(text: str, patterns: list) -> dict:
     """Find all simulant mentions in text, return {sid: count}."""
     mentions = {}
-    for sid, name, regex in patterns:
+    text_lower = text.translate(IGNORECASE_FOLD).lower()
+    for sid, name, regex, literal in patterns:
+        # A plain substring test is far cheaper than a lookaround regex scan,
+        # and most simulant names do not appear in any given source
+        if literal not in text_lower:
+            continue
         matches = regex.findall(text)
         if matches:
             mentions[sid] = len(matches)
     return mentions
 
 
+# Pattern list for pool workers, installed once by init_worker so the
+# compiled regexes are not re-pickled with every task
+_worker_patterns = []
+
+
+def init_worker(patterns: list):
+    global _worker_patterns
+    _worker_patterns = patterns
+
+
+def scan_source(html_path: Path):
+    """Extract one source's text and count simulant mentions (runs in a pool worker).
+
+    Returns (text_length, mentions), or None if the source has too little text.
+    """
+    text = extract_text_from_html(html_path)
+    if not text or len(text) < 100:
+        return None
+    return len(text), find_simulant_mentions(text, _worker_patterns)
+
+
 def extract_title_from_filename(filename: str) -> str:
     """Clean up filename to get a readable title."""
     # Remove common suffixes
@@ -141,67 +177,74 @@ def main():
     # Build name lookup
     name_lookup = {s['simulant_id']: s['name'] for s in simulants}
 
-    # Find all HTML files
-    html_files = sorted([
-        f for f in SOURCES_DIR.iterdir()
-        if f.suffix == '.html' and 'Zone.Identifier' not in f.name
-    ])
+    # Find all HTML files (scandir filters on the entry name without
+    # building a Path for every non-HTML file in the directory)
+    with os.scandir(SOURCES_DIR) as it:
+        html_files = sorted(
+            Path(e.path) for e in it
+            if e.name.endswith('.html') and 'Zone.Identifier' not in e.name
+        )
     print(f"Found {len(html_files)} HTML source files")
 
+    # PDFs available in LRS/, read in one pass instead of a stat per source
+    pdf_names = set()
+    if PDF_DIR.is_dir():
+        with os.scandir(PDF_DIR) as it:
+            pdf_names = {e.name for e in it if e.name.endswith('.pdf')}
+
     # Process each file
     index = []
     simulant_to_sources = defaultdict(list)
 
-    for i, html_path in enumerate(html_files):
-        if (i + 1) % 20 == 0:
-            print(f"  Processing {i+1}/{len(html_files)}...")
-
-        # Extract text
-        text = extract_text_from_html(html_path)
-        if not text or len(text) < 100:
-            continue
-
-        # Load metadata
-        meta = load_metadata(html_path)
-        title = meta.get('title', extract_title_from_filename(html_path.name))
-
-        # Find simulant mentions
-        mentions = find_simulant_mentions(text, patterns)
-
-        if not mentions:
-            continue
-
-        # Check if there's a matching PDF in LRS/
-        pdf_name = html_path.stem  # "paper.pdf" from "paper.pdf.html"
-        if not pdf_name.endswith('.pdf'):
-            pdf_name = pdf_name + '.pdf'  # web sources won't have .pdf
-        pdf_path = Path("/home/alvaro/LRS") / pdf_name
-        has_pdf = pdf_path.exists()
-
-        entry = {
-            'source_file': html_path.name,
-            'title': title.strip(),
-            'has_pdf': has_pdf,
-            'pdf_filename': pdf_name if has_pdf else None,
-            'simulants_mentioned': {
-                sid: {
-                    'name': name_lookup[sid],
-                    'mention_count': count
-                }
-                for sid, count in sorted(mentions.items(), key=lambda x: -x[1])
-            },
-            'simulant_count': len(mentions),
-            'text_length': len(text),
-        }
-        index.append(entry)
-
-        for sid in mentions:
-            simulant_to_sources[sid].append({
-                'source': html_path.name,
+    # Text extraction and pattern matching are CPU-bound and independent per
+    # file, so fan them out across processes; imap keeps results in file order
+    with Pool(initializer=init_worker, initargs=(patterns,)) as pool:
+        results = pool.imap(scan_source, html_files, chunksize=4)
+        for i, (html_path, result) in enumerate(zip(html_files, results)):
+            if (i + 1) % 20 == 0:
+                print(f"  Processing {i+1}/{len(html_files)}...")
+
+            if result is None:
+                continue
+            text_length, mentions = result
+
+            if not mentions:
+                continue
+
+            # Load metadata
+            meta = load_metadata(html_path)
+            title = meta.get('title', extract_title_from_filename(html_path.name))
+
+            # Check if there's a matching PDF in LRS/
+            pdf_name = html_path.stem  # "paper.pdf" from "paper.pdf.html"
+            if not pdf_name.endswith('.pdf'):
+                pdf_name = pdf_name + '.pdf'  # web sources won't have .pdf
+            has_pdf = pdf_name in pdf_names
+
+            entry = {
+                'source_file': html_path.name,
                 'title': title.strip(),
-                'mentions': mentions[sid],
                 'has_pdf': has_pdf,
-            })
+                'pdf_filename': pdf_name if has_pdf else None,
+                'simulants_mentioned': {
+                    sid: {
+                        'name': name_lookup[sid],
+                        'mention_count': count
+                    }
+                    for sid, count in sorted(mentions.items(), key=lambda x: -x[1])
+                },
+                'simulant_count': len(mentions),
+                'text_length': text_length,
+            }
+            index.append(entry)
+
+            for sid in mentions:
+                simulant_to_sources[sid].append({
+                    'source': html_path.name,
+                    'title': title.strip(),
+                    'mentions': mentions[sid],
+                    'has_pdf': has_pdf,
+                })
 
     # Sort by number of simulants mentioned (multi-simulant papers first)
     index.sort(key=lambda x: -x['simulant_count'])
@@ -16,12 +16,22 @@ import shutil
 from pathlib import Path
 from difflib import SequenceMatcher
 
+try:
+    import numpy
+    from rapidfuzz import fuzz, process
+except ImportError:  # optional; fall back to difflib for fuzzy matching
+    process = None
+
 DATA_DIR = Path(__file__).resolve().parent.parent / "public" / "data"
 CSV_DIR = Path(__file__).resolve().parent.parent.parent / "Minerals"
 LRS_CSV = CSV_DIR / "Database - LRS Constituents - LRS types (2).csv"
 MINERAL_CSV = CSV_DIR / "Database - LRS Constituents - Mineral Constituents (1).csv"
 MINERAL_PRELIM_CSV = CSV_DIR / "Database - LRS Constituents - Mineral Constituents, Preliminary (Nabila) (1).csv"
 
+# Data files read, backed up and rewritten by the merge
+DATA_FILES = ["simulant.json", "simulant_extra.json", "composition.json",
+              "chemical_composition.json", "mineral_sourcing.json"]
+
 
 # --- Name normalization for matching ---
 
@@ -39,53 +49,97 @@ NAME_MAP = {
     "CLDS-1": ["CLDS-i"],
 }
 
+# NAME_MAP keyed by lowercased spreadsheet name, with set-valued targets
+NAME_MAP_LOWER = {k.lower(): frozenset(v) for k, v in NAME_MAP.items()}
+
+# (parsed field, CSV column) pairs projected by parse_lrs_row
+LRS_FIELDS = (
+    ("name", "Simulant name"),
+    ("type", "Type"),
+    ("country", "Country"),
+    ("classification", "Classification (https://ntrs.nasa.gov/citations/20240011783)"),
+    ("application", "Application"),
+    ("city", "Column 1"),
+    ("institution", "Institution"),
+    ("stage", "Stage"),
+    ("release_date", "Release Date"),
+    ("replica_of", "Replica of"),
+    ("notes", "Notes"),
+    ("reference", "Reference"),
+    ("publicly_available", "Publicly available composition"),
+    ("feedstock", "Feedstock"),
+    ("petrographic_class", "Petrographic Class (Composition:Percentage)"),
+    ("mineral_composition_raw", "Mineral Composition (Composition;Percentage)"),
+    ("chemical_composition_raw", "Chemical Composition"),
+    ("tons_produced", "Tons produced"),
+    ("grain_size_mm", "Grain Size (mm)"),
+    ("specific_gravity", "Specific Gravity"),
+)
+
+# Separator for the flat "SiO2;45.5;Al2O3;12.3" chemical composition format
+CHEM_SEPARATOR_RE = re.compile(r'[;,]')
+
+# Existing field values that count as missing when gap-filling
+EMPTY_VALUES = (None, "", "null")
+
+# Spreadsheet "Stage" values mapped to simulant.json availability
+STAGE_MAP = {
+    "Available": "Available",
+    "Limited stock": "Limited Stock",
+    "Production stopped": "Production stopped",
+}
 
-def parse_lrs_csv(path: Path) -> list[dict]:
-    """Parse the LRS types CSV, handling embedded JSON in cells."""
-    with open(path, encoding="utf-8") as f:
-        raw = f.read()
+# (mineral_sourcing field, preliminary CSV column) pairs gap-filled per constituent
+PRELIM_FIELDS = (
+    ("supplier", "Source (Exolith)"),
+    ("chemistry", "Chemistry"),
+    ("description", "Description"),
+    ("description_simple", "Description in simple language"),
+    ("further_reading", "Further reading"),
+    ("european_sources", "Where to find in Europe"),
+)
 
-    # The CSV has multiline JSON embedded in cells. Python's csv module
-    # handles quoted multiline fields correctly.
-    reader = csv.DictReader(raw.splitlines().__iter__())
-    # But we need to re-parse because splitlines breaks multiline quoted fields.
-    # Use the file directly instead.
+# "Publicly available composition" values read as true (compared lowercased)
+TRUE_VALUES = frozenset({"true", "1", "yes", "t"})
 
-    with open(path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
 
-    parsed = []
-    for row in rows:
-        name = (row.get("Simulant name") or "").strip()
-        if not name:
-            continue
+def load_json(path: Path):
+    """Load a JSON data file."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_json(path: Path, data):
+    """Write a JSON data file, 2-space indented with non-ASCII left unescaped."""
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def parse_lrs_row(row: list[str], columns: list[tuple[str, int | None]]) -> dict:
+    """Project one LRS CSV row onto the fields used by the merge.
 
-        entry = {
-            "name": name,
-            "type": (row.get("Type") or "").strip() or None,
-            "country": (row.get("Country") or "").strip() or None,
-            "classification": (row.get("Classification (https://ntrs.nasa.gov/citations/20240011783)") or "").strip() or None,
-            "application": (row.get("Application") or "").strip() or None,
-            "city": (row.get("Column 1") or "").strip() or None,
-            "institution": (row.get("Institution") or "").strip() or None,
-            "stage": (row.get("Stage") or "").strip() or None,
-            "release_date": (row.get("Release Date") or "").strip() or None,
-            "replica_of": (row.get("Replica of") or "").strip() or None,
-            "notes": (row.get("Notes") or "").strip() or None,
-            "reference": (row.get("Reference") or "").strip() or None,
-            "publicly_available": (row.get("Publicly available composition") or "").strip(),
-            "feedstock": (row.get("Feedstock") or "").strip() or None,
-            "petrographic_class": (row.get("Petrographic Class (Composition:Percentage)") or "").strip() or None,
-            "mineral_composition_raw": (row.get("Mineral Composition (Composition;Percentage)") or "").strip() or None,
-            "chemical_composition_raw": (row.get("Chemical Composition") or "").strip() or None,
-            "tons_produced": (row.get("Tons produced") or "").strip() or None,
-            "grain_size_mm": (row.get("Grain Size (mm)") or "").strip() or None,
-            "specific_gravity": (row.get("Specific Gravity") or "").strip() or None,
-        }
-        parsed.append(entry)
-
-    return parsed
+    `columns` pairs each field with its index in the row (None if the column
+    is absent from the header); short rows read as blank.
+    """
+    width = len(row)
+    entry = {key: (row[i].strip() or None) if i is not None and i < width else None
+             for key, i in columns}
+    # Kept as a string ("" when blank); merge_simulant_data tests it for truthiness
+    entry["publicly_available"] = entry["publicly_available"] or ""
+    return entry
+
+
+def parse_lrs_csv(path: Path) -> list[dict]:
+    """Parse the LRS types CSV, handling embedded JSON in cells."""
+    # The CSV has multiline JSON embedded in cells. Python's csv module
+    # handles quoted multiline fields correctly when reading the file directly.
+    with open(path, encoding="utf-8") as f:
+        reader = csv.reader(f)
+        # Resolve column positions once; the last of any duplicate headers wins
+        header = {h: i for i, h in enumerate(next(reader, []))}
+        columns = [(key, header.get(column)) for key, column in LRS_FIELDS]
+        entries = (parse_lrs_row(row, columns) for row in reader)
+        return [entry for entry in entries if entry["name"]]
 
 
 def parse_mineral_composition(raw: str | None) -> dict | None:
@@ -96,18 +150,24 @@ def parse_mineral_composition(raw: str | None) -> dict | None:
     stripped = raw.strip()
     if not stripped.startswith("{"):
         return None
+    # Close truncated JSON up front (drop a trailing comma, add the missing
+    # closing braces) so the common truncated cell is parsed only once
+    fixed = stripped.rstrip(",")
+    open_braces = fixed.count("{") - fixed.count("}")
+    if open_braces > 0:
+        fixed += "}" * open_braces
     try:
-        return json.loads(stripped)
+        return json.loads(fixed)
     except json.JSONDecodeError:
-        # Try closing truncated JSON by adding closing braces
-        fixed = stripped.rstrip().rstrip(",")
-        open_braces = fixed.count("{") - fixed.count("}")
-        fixed += "}" * open_braces
+        pass
+    # Braces inside string values can throw the count off; try the cell as-is
+    if fixed != stripped:
         try:
-            return json.loads(fixed)
+            return json.loads(stripped)
         except json.JSONDecodeError:
-            print(f"  WARNING: Could not parse mineral composition JSON (len={len(raw)})")
-            return None
+            pass
+    print(f"  WARNING: Could not parse mineral composition JSON (len={len(raw)})")
+    return None
 
 
 def parse_chemical_composition(raw: str | None) -> list[dict] | None:
@@ -122,63 +182,124 @@ def parse_chemical_composition(raw: str | None) -> list[dict] | None:
         pass
 
     # Try semicolon-separated format: "SiO2;45.5;Al2O3;12.3"
-    parts = re.split(r'[;,]', raw)
+    parts = CHEM_SEPARATOR_RE.split(raw)
     results = []
     i = 0
     while i < len(parts) - 1:
-        oxide = parts[i].strip()
         try:
-            val = float(parts[i + 1].strip())
-            results.append({"oxide": oxide, "value_wt_pct": val})
-            i += 2
-        except (ValueError, IndexError):
-            i += 1
+            val = float(parts[i + 1])  # float() tolerates surrounding whitespace
+        except ValueError:
+            i += 1  # not an oxide;value pair here, resync on the next part
+            continue
+        results.append({"oxide": parts[i].strip(), "value_wt_pct": val})
+        i += 2
     return results if results else None
 
 
-def find_matching_simulant(name: str, simulants: list[dict]) -> list[dict]:
-    """Find matching simulant(s) by name, using NAME_MAP for known variants."""
+def build_name_index(simulants: list[dict]) -> dict[str, list[dict]]:
+    """Group simulants by lowercased name, preserving their order in the list."""
+    by_lower = {}
+    for s in simulants:
+        by_lower.setdefault(s["name"].lower(), []).append(s)
+    return by_lower
+
+
+def find_exact_simulant(name: str, simulants: list[dict],
+                        by_lower: dict[str, list[dict]]) -> list[dict] | None:
+    """Match by exact name, NAME_MAP variant or case-insensitive name.
+
+    Returns None if none of these apply and a fuzzy match should be tried.
+    """
+    name_lower = name.lower()
+    candidates = by_lower.get(name_lower, [])
+
     # Direct match
-    matches = [s for s in simulants if s["name"] == name]
+    matches = [s for s in candidates if s["name"] == name]
     if matches:
         return matches
 
     # Check NAME_MAP
-    if name in NAME_MAP:
-        targets = NAME_MAP[name]
+    targets = NAME_MAP_LOWER.get(name_lower)
+    if targets is not None:
         return [s for s in simulants if s["name"] in targets]
 
     # Case-insensitive match
-    matches = [s for s in simulants if s["name"].lower() == name.lower()]
-    if matches:
-        return matches
+    if candidates:
+        return candidates
 
-    # Fuzzy match (>0.8 similarity)
-    best_score = 0
+    return None
+
+
+def fuzzy_match_simulant(name: str, simulants: list[dict], choices: list[str],
+                         indices: list[int] | None = None) -> list[dict]:
+    """Return the most similar simulant by name (>0.8 similarity), if any.
+
+    Only the simulants at `indices` (ascending; default all) are scored, so a
+    caller that has already ruled candidates out gets the same first-best match.
+    """
+    matcher = SequenceMatcher(None, name.lower())
+    best_score = 0.8  # a match has to beat this
     best_match = None
-    for s in simulants:
-        score = SequenceMatcher(None, name.lower(), s["name"].lower()).ratio()
+    for i in range(len(simulants)) if indices is None else indices:
+        matcher.set_seq2(choices[i])
+        # Cheap upper bounds on ratio() (length- and multiset-based): skip
+        # candidates that cannot beat the best score so far
+        if matcher.real_quick_ratio() <= best_score or matcher.quick_ratio() <= best_score:
+            continue
+        score = matcher.ratio()
         if score > best_score:
             best_score = score
-            best_match = s
-    if best_score > 0.8 and best_match:
+            best_match = simulants[i]
+    if best_match:
         return [best_match]
 
     return []
 
 
-def gap_fill(target: dict, source: dict, fields: list[str]):
-    """Fill missing/null fields in target from source. Returns count of fields filled."""
-    filled = 0
-    for field in fields:
-        src_val = source.get(field)
-        if src_val is None:
-            continue
-        tgt_val = target.get(field)
-        if tgt_val is None or tgt_val == "" or tgt_val == "null":
-            target[field] = src_val
-            filled += 1
-    return filled
+def match_csv_rows(csv_rows: list[dict], simulants: list[dict]):
+    """Resolve each CSV row's simulant matches once, storing them as row["_matches"].
+
+    Exact, NAME_MAP and case-insensitive lookups run first; only the rows they
+    miss are fuzzy matched (>0.8 similarity).
+
+    All merge passes read the stored matches instead of re-running the
+    (possibly fuzzy) matcher on the same names.
+    """
+    by_lower = build_name_index(simulants)
+    choices = [s["name"].lower() for s in simulants]
+    pending = []
+    for csv_row in csv_rows:
+        matches = find_exact_simulant(csv_row["name"], simulants, by_lower)
+        if matches is None:
+            pending.append(csv_row)
+        else:
+            csv_row["_matches"] = matches
+
+    if not pending:
+        return
+    if process is None or not choices:
+        for csv_row in pending:
+            csv_row["_matches"] = fuzzy_match_simulant(csv_row["name"], simulants, choices)
+        return
+
+    # Prefilter all remaining names against all simulants in one parallel call.
+    # fuzz.ratio (Indel/LCS) is never below difflib's Ratcliff/Obershelp ratio,
+    # so any pair difflib scores above 0.8 survives the cutoff; the survivors
+    # are then re-scored with difflib so the match is the same either way
+    scores = process.cdist([r["name"].lower() for r in pending], choices,
+                           scorer=fuzz.ratio, score_cutoff=80, dtype=numpy.float64, workers=-1)
+    for csv_row, row_scores in zip(pending, scores):
+        candidates = numpy.flatnonzero(row_scores).tolist()
+        csv_row["_matches"] = fuzzy_match_simulant(
+            csv_row["name"], simulants, choices, candidates) if candidates else []
+
+
+def fill_field(target: dict, field: str, value) -> int:
+    """Set target[field] to value if it is missing/null. Returns 1 if filled, else 0."""
+    if value is not None and target.get(field) in EMPTY_VALUES:
+        target[field] = value
+        return 1
+    return 0
 
 
 def backup_file(path: Path):
@@ -198,7 +319,7 @@ def merge_simulant_data(csv_rows: list[dict], simulants: list[dict], extras: lis
 
     for csv_row in csv_rows:
         name = csv_row["name"]
-        matches = find_matching_simulant(name, simulants)
+        matches = csv_row["_matches"]
 
         if not matches:
             print(f"  SKIP: No match for '{name}'")
@@ -212,134 +333,110 @@ def merge_simulant_data(csv_rows: list[dict], simulants: list[dict], extras: lis
             extra = extra_by_id.get(sid, {})
 
             # Gap-fill simulant.json fields
-            sim_source = {}
+            filled = 0
             if csv_row["type"]:
-                sim_source["type"] = csv_row["type"]
+                filled += fill_field(sim, "type", csv_row["type"])
             if csv_row["institution"]:
-                sim_source["institution"] = csv_row["institution"]
+                filled += fill_field(sim, "institution", csv_row["institution"])
             if csv_row["stage"]:
                 # Map stage to availability
-                stage_map = {
-                    "Available": "Available",
-                    "Limited stock": "Limited Stock",
-                    "Production stopped": "Production stopped",
-                }
-                sim_source["availability"] = stage_map.get(csv_row["stage"], csv_row["stage"])
+                filled += fill_field(sim, "availability", STAGE_MAP.get(csv_row["stage"], csv_row["stage"]))
             if csv_row["release_date"]:
                 try:
-                    sim_source["release_date"] = int(csv_row["release_date"])
+                    filled += fill_field(sim, "release_date", int(csv_row["release_date"]))
                 except ValueError:
                     pass
             if csv_row["notes"]:
-                sim_source["notes"] = csv_row["notes"]
+                filled += fill_field(sim, "notes", csv_row["notes"])
             if csv_row["specific_gravity"]:
                 try:
-                    sim_source["specific_gravity"] = float(csv_row["specific_gravity"])
+                    filled += fill_field(sim, "specific_gravity", float(csv_row["specific_gravity"]))
                 except ValueError:
                     pass
             if csv_row["tons_produced"]:
                 try:
-                    sim_source["tons_produced_mt"] = float(csv_row["tons_produced"])
+                    filled += fill_field(sim, "tons_produced_mt", float(csv_row["tons_produced"]))
                 except ValueError:
                     pass
 
-            filled = gap_fill(sim, sim_source, list(sim_source.keys()))
-            stats["fields_filled"] += filled
-
             # Gap-fill simulant_extra.json fields
-            extra_source = {}
-            if csv_row["classification"]:
-                extra_source["classification"] = csv_row["classification"]
-            if csv_row["application"]:
-                extra_source["application"] = csv_row["application"]
-            if csv_row["feedstock"]:
-                extra_source["feedstock"] = csv_row["feedstock"]
-            if csv_row["replica_of"]:
-                extra_source["replica_of"] = csv_row["replica_of"]
-            if csv_row["grain_size_mm"]:
-                extra_source["grain_size_mm"] = csv_row["grain_size_mm"]
-            if csv_row["petrographic_class"]:
-                extra_source["petrographic_class"] = csv_row["petrographic_class"]
-            if csv_row["reference"]:
-                extra_source["reference"] = csv_row["reference"]
-            if csv_row["publicly_available"]:
-                extra_source["publicly_available_composition"] = csv_row["publicly_available"].upper() == "TRUE"
-
             if extra:
-                filled = gap_fill(extra, extra_source, list(extra_source.keys()))
-                stats["fields_filled"] += filled
+                for field in ("classification", "application", "feedstock", "replica_of",
+                              "grain_size_mm", "petrographic_class", "reference"):
+                    if csv_row[field]:
+                        filled += fill_field(extra, field, csv_row[field])
+                if csv_row["publicly_available"]:
+                    filled += fill_field(extra, "publicly_available_composition",
+                                         csv_row["publicly_available"].strip().lower() in TRUE_VALUES)
 
-    return stats
+            stats["fields_filled"] += filled
 
+    return stats
 
-def merge_mineral_compositions(csv_rows: list[dict], simulants: list[dict],
-                                compositions: list[dict]) -> int:
-    """Merge mineral composition JSON from CSV into composition.json."""
-    existing_sims = {c["simulant_id"] for c in compositions}
-    added = 0
 
-    for csv_row in csv_rows:
-        mineral_data = parse_mineral_composition(csv_row.get("mineral_composition_raw"))
-        if not mineral_data:
-            continue
+def merge_compositions(csv_rows: list[dict], compositions: list[dict],
+                       chemicals: list[dict]) -> tuple[int, int]:
+    """Merge mineral and chemical compositions from CSV in one pass over the rows.
 
-        matches = find_matching_simulant(csv_row["name"], simulants)
-        if not matches:
-            continue
-
-        for sim in matches:
-            sid = sim["simulant_id"]
-            # Only add if no composition exists for this simulant
-            if sid in existing_sims:
-                continue
-
-            # Flatten the grouped structure into individual composition entries
-            for group, minerals in mineral_data.items():
-                if isinstance(minerals, dict):
-                    for mineral_name, percentage in minerals.items():
-                        if percentage and percentage > 0:
-                            compositions.append({
-                                "simulant_id": sid,
-                                "mineral_name": mineral_name,
-                                "percentage": percentage,
-                                "group": group,
-                            })
-                            added += 1
-            existing_sims.add(sid)
-
-    return added
-
-
-def merge_chemical_compositions(csv_rows: list[dict], simulants: list[dict],
-                                 chemicals: list[dict]) -> int:
-    """Merge chemical composition data from CSV into chemical_composition.json."""
-    existing_sims = {c["simulant_id"] for c in chemicals}
-    added = 0
+    Mineral JSON goes into composition.json and oxides into
+    chemical_composition.json, only for simulants with no existing entries.
+    Returns (mineral entries added, chemical entries added).
+    """
+    mineral_sims = {c["simulant_id"] for c in compositions}
+    chem_sims = {c["simulant_id"] for c in chemicals}
+    comp_added = 0
+    chem_added = 0
 
     for csv_row in csv_rows:
-        chem_data = parse_chemical_composition(csv_row.get("chemical_composition_raw"))
-        if not chem_data:
+        matches = csv_row["_matches"]
+        if not matches:
             continue
 
-        matches = find_matching_simulant(csv_row["name"], simulants)
-        if not matches:
+        # Only parse a column if some matched simulant still lacks that data
+        mineral_data = None
+        if any(sim["simulant_id"] not in mineral_sims for sim in matches):
+            mineral_data = parse_mineral_composition(csv_row.get("mineral_composition_raw"))
+        chem_data = None
+        if any(sim["simulant_id"] not in chem_sims for sim in matches):
+            chem_data = parse_chemical_composition(csv_row.get("chemical_composition_raw"))
+        if not mineral_data and not chem_data:
             continue
 
         for sim in matches:
             sid = sim["simulant_id"]
-            if sid in existing_sims:
-                continue
-
-            for entry in chem_data:
-                chemicals.append({
-                    "simulant_id": sid,
-                    "oxide": entry["oxide"],
-                    "value_wt_pct": entry["value_wt_pct"],
-                })
-                added += 1
-            existing_sims.add(sid)
 
-    return added
+            # Only add if no composition exists for this simulant
+            if mineral_data and sid not in mineral_sims:
+                # Flatten the grouped structure into individual composition entries
+                for group, minerals in mineral_data.items():
+                    if isinstance(minerals, dict):
+                        for mineral_name, percentage in minerals.items():
+                            if percentage and percentage > 0:
+                                compositions.append({
+                                    "simulant_id": sid,
+                                    "mineral_name": mineral_name,
+                                    "percentage": percentage,
+                                    "group": group,
+                                })
+                                comp_added += 1
+                mineral_sims.add(sid)
+
+            if chem_data and sid not in chem_sims:
+                for entry in chem_data:
+                    chemicals.append({
+                        "simulant_id": sid,
+                        "oxide": entry["oxide"],
+                        "value_wt_pct": entry["value_wt_pct"],
+                    })
+                    chem_added += 1
+                chem_sims.add(sid)
+
+    return comp_added, chem_added
+
+
+def csv_value(row: dict, column: str) -> str | None:
+    """Return a CSV cell stripped of whitespace, or None if missing or blank."""
+    return (row.get(column) or "").strip() or None
 
 
 def merge_mineral_sourcing(mineral_csv: Path, prelim_csv: Path, existing: list[dict]) -> list[dict]:
@@ -350,72 +447,48 @@ def merge_mineral_sourcing(mineral_csv: Path, prelim_csv: Path, existing: list[d
     with open(mineral_csv, encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
-            name = (row.get("Chemical compound present in LRS") or "").strip()
+            name = csv_value(row, "Chemical compound present in LRS")
             if not name:
                 continue
 
             key = name.lower()
-            if key in existing_by_name:
-                entry = existing_by_name[key]
-            else:
+            entry = existing_by_name.get(key)
+            if entry is None:
                 entry = {"mineral_name": name}
                 existing_by_name[key] = entry
 
             # Gap-fill from CSV
-            source_mineral = (row.get("Source mineral") or "").strip()
+            source_mineral = csv_value(row, "Source mineral")
             if source_mineral and not entry.get("source_mineral"):
                 entry["source_mineral"] = source_mineral
                 entry["chemistry"] = source_mineral  # backwards compat
 
-            mining_locs = (row.get("Mine currently operative") or "").strip()
+            mining_locs = csv_value(row, "Mine currently operative")
             if mining_locs and not entry.get("mining_locations"):
                 entry["mining_locations"] = mining_locs
 
-            company = (row.get("Mining Company") or "").strip()
+            company = csv_value(row, "Mining Company")
             if company and not entry.get("mining_company"):
                 entry["mining_company"] = company
 
     # Parse the preliminary (Nabila) CSV for supplier info
     with open(prelim_csv, encoding="utf-8") as f:
         reader = csv.DictReader(f)
-        current_constituent = None
+        current_key = None
         for row in reader:
-            constituent = (row.get("Constituent") or "").strip()
+            # Constituent is only given on the first row of each group
+            constituent = csv_value(row, "Constituent")
             if constituent:
-                current_constituent = constituent
+                current_key = constituent.lower()
 
-            if not current_constituent:
+            entry = existing_by_name.get(current_key)
+            if entry is None:
                 continue
 
-            key = current_constituent.lower()
-            if key not in existing_by_name:
-                continue
-
-            entry = existing_by_name[key]
-
-            source = (row.get("Source (Exolith)") or "").strip()
-            if source and not entry.get("supplier"):
-                entry["supplier"] = source
-
-            chemistry = (row.get("Chemistry") or "").strip()
-            if chemistry and not entry.get("chemistry"):
-                entry["chemistry"] = chemistry
-
-            desc = (row.get("Description") or "").strip()
-            if desc and not entry.get("description"):
-                entry["description"] = desc
-
-            desc_simple = (row.get("Description in simple language") or "").strip()
-            if desc_simple and not entry.get("description_simple"):
-                entry["description_simple"] = desc_simple
-
-            reading = (row.get("Further reading") or "").strip()
-            if reading and not entry.get("further_reading"):
-                entry["further_reading"] = reading
-
-            europe = (row.get("Where to find in Europe") or "").strip()
-            if europe and not entry.get("european_sources"):
-                entry["european_sources"] = europe
+            for field, column in PRELIM_FIELDS:
+                value = csv_value(row, column)
+                if value and not entry.get(field):
+                    entry[field] = value
 
     return list(existing_by_name.values())
 
@@ -425,16 +498,12 @@ def main():
 
     # Load existing data
     print("Loading existing data...")
-    with open(DATA_DIR / "simulant.json") as f:
-        simulants = json.load(f)
-    with open(DATA_DIR / "simulant_extra.json") as f:
-        extras = json.load(f)
-    with open(DATA_DIR / "composition.json") as f:
-        compositions = json.load(f)
-    with open(DATA_DIR / "chemical_composition.json") as f:
-        chemicals = json.load(f)
-    with open(DATA_DIR / "mineral_sourcing.json") as f:
-        mineral_sourcing = json.load(f)
+    data = {fname: load_json(DATA_DIR / fname) for fname in DATA_FILES}
+    simulants = data["simulant.json"]
+    extras = data["simulant_extra.json"]
+    compositions = data["composition.json"]
+    chemicals = data["chemical_composition.json"]
+    mineral_sourcing = data["mineral_sourcing.json"]
 
     print(f"  {len(simulants)} simulants, {len(extras)} extras")
     print(f"  {len(compositions)} compositions, {len(chemicals)} chemicals")
@@ -443,12 +512,12 @@ def main():
     # Parse CSV
     print("Parsing spreadsheet CSV...")
     csv_rows = parse_lrs_csv(LRS_CSV)
+    match_csv_rows(csv_rows, simulants)
     print(f"  {len(csv_rows)} rows parsed\n")
 
     # Backup files
     print("Creating backups...")
-    for fname in ["simulant.json", "simulant_extra.json", "composition.json",
-                   "chemical_composition.json", "mineral_sourcing.json"]:
+    for fname in DATA_FILES:
         backup_file(DATA_DIR / fname)
     print()
 
@@ -459,14 +528,10 @@ def main():
     print(f"  Unmatched: {stats['unmatched']}")
     print(f"  Fields gap-filled: {stats['fields_filled']}\n")
 
-    # Merge mineral compositions
-    print("Merging mineral compositions...")
-    comp_added = merge_mineral_compositions(csv_rows, simulants, compositions)
-    print(f"  Composition entries added: {comp_added}\n")
-
-    # Merge chemical compositions
-    print("Merging chemical compositions...")
-    chem_added = merge_chemical_compositions(csv_rows, simulants, chemicals)
+    # Merge mineral + chemical compositions
+    print("Merging mineral and chemical compositions...")
+    comp_added, chem_added = merge_compositions(csv_rows, compositions, chemicals)
+    print(f"  Composition entries added: {comp_added}")
     print(f"  Chemical entries added: {chem_added}\n")
 
     # Merge mineral sourcing
@@ -476,16 +541,15 @@ def main():
 
     # Write updated files
     print("Writing updated data files...")
-    with open(DATA_DIR / "simulant.json", "w") as f:
-        json.dump(simulants, f, indent=2, ensure_ascii=False)
-    with open(DATA_DIR / "simulant_extra.json", "w") as f:
-        json.dump(extras, f, indent=2, ensure_ascii=False)
-    with open(DATA_DIR / "composition.json", "w") as f:
-        json.dump(compositions, f, indent=2, ensure_ascii=False)
-    with open(DATA_DIR / "chemical_composition.json", "w") as f:
-        json.dump(chemicals, f, indent=2, ensure_ascii=False)
-    with open(DATA_DIR / "mineral_sourcing.json", "w") as f:
-        json.dump(mineral_sourcing, f, indent=2, ensure_ascii=False)
+    outputs = {
+        "simulant.json": simulants,
+        "simulant_extra.json": extras,
+        "composition.json": compositions,
+        "chemical_composition.json": chemicals,
+        "mineral_sourcing.json": mineral_sourcing,
+    }
+    for fname, output in outputs.items():
+        save_json(DATA_DIR / fname, output)
 
     print("  Done!\n")
     print("=== Summary ===")
@@ -40,28 +40,41 @@ def main():
         if count > 1:
             errors.append(f"Duplicate simulant_id: {sid} ({count} times)")
 
+    # Coverage sets for step 9 are collected during the orphan checks,
+    # so each list is only walked once
+    sids_with_extra = set()
+    sids_with_site = set()
+    sids_with_comp = set()
+    sids_with_chem = set()
+    sids_with_ref = set()
+
     # 2. Every extra has a matching simulant
     for e in extras:
+        sids_with_extra.add(e["simulant_id"])
         if e["simulant_id"] not in sim_ids:
             errors.append(f"simulant_extra orphan: {e['simulant_id']} ({e.get('name')})")
 
     # 3. Every site has a matching simulant
     for s in sites:
+        sids_with_site.add(s["simulant_id"])
         if s["simulant_id"] not in sim_ids:
             errors.append(f"site orphan: {s['simulant_id']} ({s.get('site_name')})")
 
     # 4. Every composition has a matching simulant
     for c in compositions:
+        sids_with_comp.add(c["simulant_id"])
         if c["simulant_id"] not in sim_ids:
             errors.append(f"composition orphan: {c['simulant_id']} ({c.get('mineral_name')})")
 
     # 5. Every chemical has a matching simulant
     for c in chemicals:
+        sids_with_chem.add(c["simulant_id"])
         if c["simulant_id"] not in sim_ids:
             errors.append(f"chemical orphan: {c['simulant_id']} ({c.get('oxide')})")
 
     # 6. Every reference has a matching simulant
     for r in references:
+        sids_with_ref.add(r["simulant_id"])
         if r["simulant_id"] not in sim_ids:
             errors.append(f"reference orphan: {r['simulant_id']}")
 
@@ -78,12 +91,6 @@ def main():
             errors.append(f"Simulant missing simulant_id")
 
     # 9. Coverage stats
-    sids_with_comp = set(c["simulant_id"] for c in compositions)
-    sids_with_chem = set(c["simulant_id"] for c in chemicals)
-    sids_with_ref = set(r["simulant_id"] for r in references)
-    sids_with_site = set(s["simulant_id"] for s in sites)
-    sids_with_extra = set(e["simulant_id"] for e in extras)
-
     no_comp = sim_ids - sids_with_comp
     no_chem = sim_ids - sids_with_chem
     no_ref = sim_ids - sids_with_ref